@@ -1,12 +1,24 @@
+import os
 import calendar
 import numpy as np
 import pandas as pd
 import altair as alt
 import streamlit as st
-from typing import Tuple
+from typing import Any, Dict, List, Tuple, Union
+from numba import njit
 from millify import millify
 import plotly.graph_objects as go
 
+# Optional Modin backend for the groupby-heavy data loading
+USE_MODIN = os.environ.get("INSIGHTIFY_USE_MODIN") == "1"
+if USE_MODIN:
+    try:
+        import modin.config
+        import modin.pandas as mpd
+        from modin.pandas.io import to_pandas
+        modin.config.Engine.get()  # raises ImportError when no engine is installed
+    except ImportError:
+        USE_MODIN = False
 
 # Constants
 PAGE_CONFIG = {
@@ -22,29 +34,189 @@ CUSTOM_COLORS = {
     'Technology': '#042940'
 }
 
+REGION_PALETTE = {
+    'West': '#005C53',
+    'East': '#9FC131',
+    'Central': '#DBF227',
+    'South': '#D6FF79'
+}
+
+RGBA_PALETTE = {
+    name: f"rgba({int(h[1:3], 16)}, {int(h[3:5], 16)}, {int(h[5:7], 16)}, 0.7)"
+    for name, h in REGION_PALETTE.items()
+}
+
+YEAR_PALETTE = {
+    2020: '#005C53',
+    2021: '#9FC131',
+    2022: '#DBF227',
+    2023: '#D6FF79'
+}
+
+STATIC_PLOT_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+
+DATASET_PATH = 'dataset/superstore_enriched.parquet'
+
+# Bump when the shape or meaning of the load_data result changes, so
+# results persisted to disk by an older version are not reused.
+AGGREGATES_VERSION = 1
+
+NS_PER_DAY = np.int64(86_400_000_000_000)
+
 MONTHS = list(calendar.month_abbr)[1:]
+MONTH_ABBR = np.array(MONTHS)
+
+# Figure Caching
+def hash_frame(df: pd.DataFrame) -> Tuple:
+    """Hash a small precomputed frame by shape, columns and values."""
+    return (df.shape, tuple(df.columns), hash(pd.util.hash_pandas_object(df).values.tobytes()))
+
+cache_figure = st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: hash_frame})
 
 # Data Loading
-@st.cache_data(ttl=3600)
-def load_data() -> Tuple[pd.DataFrame, pd.Series, pd.Series, pd.Series]:
-    """Load and preprocess the dataset."""
-    df = pd.read_excel('dataset/superstore_enriched.xlsx')
-    df['year'] = pd.to_datetime(df['Order Date']).dt.year
-    df['days to ship'] = abs(pd.to_datetime(df['Ship Date']) - pd.to_datetime(df['Order Date'])).dt.days
+@st.cache_data(persist="disk", max_entries=8, show_spinner="Loading superstore…")
+def load_data(dataset_mtime: float, aggregates_version: int) -> Tuple[List[Union[int, str]], pd.DataFrame, pd.DataFrame, Dict[Union[int, str], Dict[str, Any]]]:
+    """Load and preprocess the dataset.
+    
+    The arguments are only part of the cache key: a rebuilt dataset or a
+    bumped AGGREGATES_VERSION invalidates the persisted result.
+    """
+    backend = mpd if USE_MODIN else pd
+    df = backend.read_parquet(DATASET_PATH, engine='pyarrow')
+    df['year'] = df['Order Date'].dt.year.astype('int16')
+    df['month_num'] = df['Order Date'].dt.month.astype('int8')
+    order_ns = df['Order Date'].to_numpy(dtype='datetime64[ns]').view('i8')
+    ship_ns = df['Ship Date'].to_numpy(dtype='datetime64[ns]').view('i8')
+    df['days to ship'] = (np.abs(ship_ns - order_ns) // NS_PER_DAY).astype('int16')
+    df = df.drop(columns=['Order Date', 'Ship Date'])
+    df = df.astype({
+        'Category': 'category',
+        'Region': 'category',
+        'Segment': 'category',
+        'Product Name': 'category'
+    })
+    
+    grp_years = get_per_year_totals(df)
     
     return (
-        df,
-        get_per_year_change('Sales', df, 'sum'),
-        get_per_year_change('Profit', df, 'sum'),
-        get_per_year_change('Order ID', df, 'count')
+        ["All"] + sorted(df['year'].unique().tolist()),
+        get_per_year_changes(grp_years),
+        get_kpi_totals(df, grp_years),
+        build_aggregates(df)
     )
 
-def get_per_year_change(col: str, df: pd.DataFrame, metric: str) -> pd.Series:
-    """Calculate percentage change for a column by year."""
-    grp_years = df.groupby('year')[col].agg([metric])[metric]
-    grp_years = grp_years.pct_change() * 100
-    grp_years.fillna(0, inplace=True)
-    return grp_years.apply(lambda x: f"{x:.1f}%" if pd.notnull(x) else 'NaN')
+def as_pandas(obj: Any) -> Any:
+    """Convert a Modin result to pandas so the charts always receive pandas objects."""
+    return to_pandas(obj) if USE_MODIN else obj
+
+def build_aggregates(df: pd.DataFrame) -> Dict[Union[int, str], Dict[str, Any]]:
+    """Precompute the chart aggregates for every year, plus an "All" entry."""
+    category_perf = as_pandas(df.groupby(['year', 'Category'], observed=True, sort=False).agg({
+        'Sales': 'sum',
+        'Profit': 'sum',
+        'Order ID': 'count'
+    }))
+    order_dist = as_pandas(df.groupby(['year', 'Region', 'Segment'], observed=True, sort=False).size()).rename('Count')
+    products = as_pandas(df.groupby(['year', 'Product Name'], observed=True, sort=False)[['Sales', 'Profit']].sum())
+    ship_stats = get_ship_stats(df)
+    monthly_sales = get_monthly_sales(df)
+    sales_trend = category_perf['Sales'].reset_index()
+    
+    aggregates = {
+        "All": summarize_aggregates(
+            category_perf.groupby(level='Category', observed=True, sort=False).sum(),
+            order_dist.groupby(level=['Region', 'Segment'], observed=True, sort=False).sum(),
+            products.groupby(level='Product Name', observed=True, sort=False).sum(),
+            ship_stats.loc["All"],
+            monthly_sales,
+            sales_trend
+        )
+    }
+    for year in monthly_sales.index.tolist():
+        aggregates[year] = summarize_aggregates(
+            category_perf.xs(year, level='year'),
+            order_dist.xs(year, level='year'),
+            products.xs(year, level='year'),
+            ship_stats.loc[year],
+            monthly_sales.loc[[year]],
+            sales_trend[sales_trend['year'] == year]
+        )
+    
+    return aggregates
+
+def summarize_aggregates(
+    category_perf: pd.DataFrame,
+    order_dist: pd.Series,
+    products: pd.DataFrame,
+    ship_stats: pd.Series,
+    monthly_sales: pd.DataFrame,
+    sales_trend: pd.DataFrame
+) -> Dict[str, Any]:
+    """Shape the reduced tables of a single selection into chart inputs."""
+    return {
+        "category_perf": category_perf.reset_index(),
+        "order_dist": order_dist.reset_index(),
+        "monthly_sales": monthly_sales,
+        "top_sales": get_top_products(products, 'Sales'),
+        "top_profit": get_top_products(products, 'Profit'),
+        "ship_stats": ship_stats,
+        "sales_trend": sales_trend
+    }
+
+def get_ship_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """Summarize shipping days by year, plus an "All" row."""
+    days = df['days to ship'].to_numpy()
+    all_stats = pd.DataFrame({
+        'min': [days.min()],
+        'mean': [days.mean()],
+        'max': [days.max()]
+    }, index=["All"])
+    return pd.concat([all_stats, as_pandas(df.groupby('year')['days to ship'].agg(['min', 'mean', 'max']))])
+
+@njit(cache=True)
+def monthly_sum(year_idx: np.ndarray, month: np.ndarray, sales: np.ndarray, out: np.ndarray):
+    """Accumulate sales into a (year, month) matrix."""
+    for i in range(year_idx.shape[0]):
+        out[year_idx[i], month[i] - 1] += sales[i]
+
+def get_monthly_sales(df: pd.DataFrame) -> pd.DataFrame:
+    """Calculate monthly sales as a year by month table."""
+    year = df['year'].to_numpy()
+    years = np.unique(year)
+    out = np.zeros((len(years), 12))
+    monthly_sum(np.searchsorted(years, year), df['month_num'].to_numpy(), df['Sales'].to_numpy(), out)
+    return pd.DataFrame(out, index=pd.Index(years, name='year'), columns=MONTH_ABBR)
+
+def get_top_products(products: pd.DataFrame, metric: str, k: int = 10) -> pd.DataFrame:
+    """Select the top k products by metric without sorting the full table."""
+    values = products[metric].to_numpy()
+    if len(values) > k:
+        products = products.iloc[np.argpartition(-values, k)[:k]]
+    return products[metric].sort_values(ascending=False).reset_index()
+
+def get_per_year_totals(df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate sales, profit and order counts by year."""
+    return as_pandas(df.groupby('year').agg(
+        Sales=('Sales', 'sum'),
+        Profit=('Profit', 'sum'),
+        Orders=('Order ID', 'count'),
+        Unique_Orders=('Order ID', 'nunique')
+    ))
+
+def get_kpi_totals(df: pd.DataFrame, grp_years: pd.DataFrame) -> pd.DataFrame:
+    """Collect the KPI totals for every year, plus an "All" row."""
+    all_totals = pd.DataFrame({
+        'Sales': [grp_years['Sales'].sum()],
+        'Profit': [grp_years['Profit'].sum()],
+        'Unique_Orders': [df['Order ID'].nunique()]
+    }, index=["All"])
+    return pd.concat([all_totals, grp_years[['Sales', 'Profit', 'Unique_Orders']]])
+
+def get_per_year_changes(grp_years: pd.DataFrame) -> pd.DataFrame:
+    """Calculate percentage change of sales, profit and orders by year."""
+    grp_years = grp_years[['Sales', 'Profit', 'Orders']].pct_change() * 100
+    grp_years = grp_years.fillna(0)
+    return grp_years.map(lambda x: f"{x:.1f}%")
 
 # UI Styling
 def set_page_style():
@@ -100,100 +272,68 @@ def create_header():
     st.markdown("<h2 style='text-align: center;'>Superstore Sales</h2>", unsafe_allow_html=True)
     st.write("")
 
-def create_sidebar(df: pd.DataFrame) -> int:
+def create_sidebar(year_options: List[Union[int, str]]) -> Union[int, str]:
     """Create sidebar with year filter."""
-    year_list = sorted(df['year'].unique().tolist())
-    year_list.insert(0, "All")
-    return st.sidebar.selectbox("Select a year", year_list)
-
-def filter_data(df: pd.DataFrame, selected_year: str) -> pd.DataFrame:
-    """Filter dataframe based on selected year."""
-    if selected_year != "All":
-        return df[df['year'] == int(selected_year)]
-    return df
+    return st.sidebar.selectbox("Select a year", year_options)
 
 def create_kpi_metrics(
-    df: pd.DataFrame,
-    grp_years_sales: pd.Series,
-    grp_year_profit: pd.Series,
-    grp_year_orders: pd.Series,
-    selected_year: str
+    kpi_totals: pd.DataFrame,
+    grp_years_changes: pd.DataFrame,
+    selected_year: Union[int, str]
 ):
     """Create KPI metrics section."""
-    total_sales = df['Sales'].sum()
-    total_profit = df['Profit'].sum()
-    total_orders = df['Order ID'].nunique()
+    total_sales = kpi_totals.at[selected_year, 'Sales']
+    total_profit = kpi_totals.at[selected_year, 'Profit']
+    total_orders = kpi_totals.at[selected_year, 'Unique_Orders']
     
     if selected_year == "All":
-        sales_change = grp_years_sales.iloc[-1]
-        profit_change = grp_year_profit.iloc[-1]
-        orders_change = grp_year_orders.iloc[-1]
+        changes = grp_years_changes.iloc[-1]
     else:
-        sales_change = grp_years_sales.get(selected_year, "0%")
-        profit_change = grp_year_profit.get(selected_year, "0%")
-        orders_change = grp_year_orders.get(selected_year, "0%")
+        changes = grp_years_changes.loc[selected_year]
     
     col1, col2, col3 = st.columns(3)
-    col1.metric("Sales", f"${millify(total_sales, precision=2)}", sales_change)
-    col2.metric("Profit", f"${millify(total_profit, precision=2)}", profit_change)
-    col3.metric("Orders", total_orders, orders_change)
+    col1.metric("Sales", f"${millify(total_sales, precision=2)}", changes['Sales'])
+    col2.metric("Profit", f"${millify(total_profit, precision=2)}", changes['Profit'])
+    col3.metric("Orders", total_orders, changes['Orders'])
     
     style_metric_cards(border_left_color="#DBF227")
 
-def create_category_performance_chart(df: pd.DataFrame):
+@cache_figure
+def create_category_performance_chart(category_perf: pd.DataFrame):
     """Create a scatter plot showing Sales vs Profit by Category."""
-    category_perf = df.groupby('Category').agg({
-        'Sales': 'sum',
-        'Profit': 'sum',
-        'Order ID': 'count'
-    }).reset_index()
-    
-    fig = go.Figure()
-    
-    for category in category_perf['Category']:
-        cat_data = category_perf[category_perf['Category'] == category]
-        fig.add_trace(go.Scatter(
-            x=[cat_data['Sales'].iloc[0]],
-            y=[cat_data['Profit'].iloc[0]],
-            mode='markers+text',
-            name=category,
-            marker=dict(size=cat_data['Order ID'] / 50, color=CUSTOM_COLORS[category]),
-            text=[category],
-            textposition="top center"
-        ))
+    fig = go.Figure(go.Scatter(
+        x=category_perf['Sales'],
+        y=category_perf['Profit'],
+        mode='markers+text',
+        marker=dict(
+            size=category_perf['Order ID'] / 50,
+            color=category_perf['Category'].map(CUSTOM_COLORS)
+        ),
+        text=category_perf['Category'],
+        textposition="top center",
+        hovertemplate='%{text}<br>Sales=%{x}<br>Profit=%{y}<extra></extra>'
+    ))
     
     fig.update_layout(
         title="Category Performance: Sales vs Profit",
         xaxis_title="Sales ($)",
         yaxis_title="Profit ($)",
-        height=400
+        height=400,
+        uirevision='const'
     )
     
     return fig
 
-def create_order_distribution_chart(df: pd.DataFrame):
+@cache_figure
+def create_order_distribution_chart(order_dist: pd.DataFrame):
     """Create a sunburst chart showing order distribution by Region and Segment."""
-    order_dist = df.groupby(['Region', 'Segment']).size().reset_index(name='Count')
-    color_palette = {
-        'West': '#005C53',
-        'East': '#9FC131',
-        'Central': '#DBF227',
-        'South': '#D6FF79'
-    }
-    labels, parents, values, colors = [], [], [], []
-    for region in order_dist['Region'].unique():
-        labels.append(region)
-        parents.append("")
-        region_total = order_dist[order_dist['Region'] == region]['Count'].sum()
-        values.append(region_total)
-        colors.append(color_palette[region])
+    region_totals = order_dist.groupby('Region', observed=True, sort=False)['Count'].sum()
+    regions = order_dist['Region'].astype(str)
     
-    for _, row in order_dist.iterrows():
-        labels.append(f"{row['Region']} - {row['Segment']}")
-        parents.append(row['Region'])
-        values.append(row['Count'])
-        region_color = color_palette[row['Region']]
-        colors.append(f"rgba{tuple(int(region_color.lstrip('#')[i:i+2], 16) for i in (0, 2, 4)) + (0.7,)}")
+    labels = region_totals.index.astype(str).tolist() + (regions + " - " + order_dist['Segment'].astype(str)).tolist()
+    parents = [""] * len(region_totals) + regions.tolist()
+    values = region_totals.tolist() + order_dist['Count'].tolist()
+    colors = [REGION_PALETTE[region] for region in region_totals.index] + regions.map(RGBA_PALETTE).tolist()
     
     fig = go.Figure(go.Sunburst(
         labels=labels,
@@ -206,36 +346,23 @@ def create_order_distribution_chart(df: pd.DataFrame):
     fig.update_layout(
         title="Order Distribution by Region and Segment",
         height=500,
-        width=None
+        width=None,
+        uirevision='const'
     )
     
     return fig
 
-def create_monthly_sales_trend(df: pd.DataFrame):
+@cache_figure
+def create_monthly_sales_trend(monthly_sales: pd.DataFrame):
     """Create a line chart showing monthly sales trends."""
-    color_palette = {
-        2020: '#005C53',
-        2021: '#9FC131',
-        2022: '#DBF227',
-        2023: '#D6FF79'
-    }
-    
-    df['Month'] = pd.to_datetime(df['Order Date']).dt.strftime('%b')
-    df['Month_num'] = pd.to_datetime(df['Order Date']).dt.month
-    monthly_sales = df.groupby(['year', 'Month', 'Month_num']).agg({
-        'Sales': 'sum'
-    }).reset_index()
-    monthly_sales = monthly_sales.sort_values(['year', 'Month_num'])
-    
     fig = go.Figure()
-    for year in monthly_sales['year'].unique():
-        year_data = monthly_sales[monthly_sales['year'] == year]
+    for year, sales in zip(monthly_sales.index, monthly_sales.to_numpy()):
         fig.add_trace(go.Scatter(
-            x=year_data['Month'],
-            y=year_data['Sales'],
+            x=monthly_sales.columns,
+            y=sales,
             name=str(year),
             mode='lines+markers',
-            line=dict(color=color_palette.get(year, '#000000'))
+            line=dict(color=YEAR_PALETTE.get(year, '#000000'))
         ))
     
     fig.update_layout(
@@ -243,56 +370,53 @@ def create_monthly_sales_trend(df: pd.DataFrame):
         xaxis_title="Month",
         yaxis_title="Sales ($)",
         xaxis=dict(categoryorder='array', categoryarray=MONTHS),
-        height=400
+        height=400,
+        uirevision='const'
     )
     
     return fig
 
-def create_product_charts(df: pd.DataFrame):
+def create_product_charts(top_sales: pd.DataFrame, top_profit: pd.DataFrame):
     """Create product sales and profit charts."""
     col1, col2 = st.columns(2)
     
     with col1:
-        create_top_products_chart(df, 'Sales', "Top 10 Selling Products")
+        create_top_products_chart(top_sales, 'Sales', "Top 10 Selling Products")
     
     with col2:
-        create_top_products_chart(df, 'Profit', "Top 10 Most Profitable Products")
+        create_top_products_chart(top_profit, 'Profit', "Top 10 Most Profitable Products")
 
-def create_top_products_chart(df: pd.DataFrame, metric: str, title: str):
+def create_top_products_chart(top_products: pd.DataFrame, metric: str, title: str):
     """Create a bar chart for top products by metric."""
-    top_products = (df.groupby('Product Name')[metric]
-                   .sum()
-                   .nlargest(10)
-                   .reset_index())
-    
     chart = alt.Chart(top_products).mark_bar(opacity=0.9, color="#9FC131").encode(
-        x=alt.X(f'sum({metric}):Q'),
+        x=alt.X(f'{metric}:Q', title=f'Sum of {metric}'),
         y=alt.Y('Product Name:N', sort='-x')
     ).properties(title=title)
     
     st.altair_chart(chart, use_container_width=True)
 
-def create_shipping_gauge(df: pd.DataFrame):
+@cache_figure
+def create_shipping_gauge(ship_stats: pd.Series):
     """Create shipping days gauge chart."""
-    value = int(np.round(df['days to ship'].mean()))
+    value = int(np.round(ship_stats['mean']))
     
     fig = go.Figure(go.Indicator(
         mode="gauge+number",
         value=value,
         title={'text': "Average Shipping Days"},
         gauge={
-            'axis': {'range': [df['days to ship'].min(), df['days to ship'].max()]},
+            'axis': {'range': [ship_stats['min'], ship_stats['max']]},
             'bar': {'color': "#005C53"},
         }
     ))
     
-    fig.update_layout(height=350)
+    fig.update_layout(height=350, uirevision='const')
     return fig
 
-def create_sales_trend_chart(df: pd.DataFrame):
+def create_sales_trend_chart(sales_trend: pd.DataFrame):
     """Create sales trend chart by category."""
-    bars = alt.Chart(df).mark_bar().encode(
-        y=alt.Y('sum(Sales):Q', stack='zero', axis=alt.Axis(format='~s')),
+    bars = alt.Chart(sales_trend).mark_bar().encode(
+        y=alt.Y('Sales:Q', stack='zero', title='Sum of Sales', axis=alt.Axis(format='~s')),
         x=alt.X('year:N'),
         color=alt.Color('Category:N', scale=alt.Scale(
             domain=list(CUSTOM_COLORS.keys()),
@@ -300,63 +424,88 @@ def create_sales_trend_chart(df: pd.DataFrame):
         ))
     )
     
-    text = alt.Chart(df).mark_text(dx=-15, dy=30, color='white').encode(
-        y=alt.Y('sum(Sales):Q', stack='zero'),
+    text = alt.Chart(sales_trend).mark_text(dx=-15, dy=30, color='white').encode(
+        y=alt.Y('Sales:Q', stack='zero'),
         x=alt.X('year:N'),
         detail='Category:N',
-        text=alt.Text('sum(Sales):Q', format='~s')
+        text=alt.Text('Sales:Q', format='~s')
     )
     
     return (bars + text).properties(
         title="Sales trends for Product Categories over the years"
     )
 
-def main():
-    """Main function to run the Streamlit dashboard."""
-    st.set_page_config(**PAGE_CONFIG)
-    set_page_style()
-    
-    # Load data
-    df_original, grp_years_sales, grp_year_profit, grp_year_orders = load_data()
-    
-    # Create sidebar and filter data
-    selected_year = create_sidebar(df_original)
-    df = filter_data(df_original, selected_year)
-    
-    # Create dashboard sections
-    create_header()
-    
+# Dashboard Sections
+@st.fragment
+def kpi_block(kpi_totals: pd.DataFrame, grp_years_changes: pd.DataFrame, selected_year: Union[int, str]):
+    """Render the KPI metrics section."""
     create_kpi_metrics(
-        df, grp_years_sales, grp_year_profit, grp_year_orders, selected_year
+        kpi_totals, grp_years_changes, selected_year
     )
-    
-    # Category Performance Analysis
+
+@st.fragment
+def category_block(charts: Dict[str, Any]):
+    """Render the category performance section."""
     st.subheader("Category Performance Analysis")
     col1, col2 = st.columns(2)
     
     with col1:
-        st.plotly_chart(create_category_performance_chart(df), use_container_width=True)
+        st.plotly_chart(create_category_performance_chart(charts['category_perf']), use_container_width=True)
     
     with col2:
-        st.plotly_chart(create_order_distribution_chart(df), use_container_width=True)
-    
-    # Monthly sales trend
+        st.plotly_chart(
+            create_order_distribution_chart(charts['order_dist']),
+            use_container_width=True,
+            config=STATIC_PLOT_CONFIG
+        )
+
+@st.fragment
+def trends_block(charts: Dict[str, Any]):
+    """Render the monthly sales trend section."""
     st.subheader("Sales Trends")
-    st.plotly_chart(create_monthly_sales_trend(df), use_container_width=True)
-    
-    # Product Performance
+    st.plotly_chart(create_monthly_sales_trend(charts['monthly_sales']), use_container_width=True)
+
+@st.fragment
+def products_block(charts: Dict[str, Any]):
+    """Render the product performance section."""
     st.subheader("Product Performance")
-    create_product_charts(df)
-    
-    # Shipping and Category Trends
+    create_product_charts(charts['top_sales'], charts['top_profit'])
+
+@st.fragment
+def shipping_block(charts: Dict[str, Any]):
+    """Render the shipping and category trends section."""
     st.subheader("Shipping and Category Trends")
     col1, col2 = st.columns([1, 2])
     with col1:
-        st.plotly_chart(create_shipping_gauge(df), use_container_width=True)
+        st.plotly_chart(
+            create_shipping_gauge(charts['ship_stats']),
+            use_container_width=True,
+            config=STATIC_PLOT_CONFIG
+        )
     
     with col2:
-        sales_trend_chart = create_sales_trend_chart(df)
+        sales_trend_chart = create_sales_trend_chart(charts['sales_trend'])
         st.altair_chart(sales_trend_chart, use_container_width=True)
 
+def main():
+    """Main function to run the Streamlit dashboard."""
+    st.set_page_config(**PAGE_CONFIG)
+    set_page_style()
+    
+    # Load data
+    year_options, grp_years_changes, kpi_totals, aggregates = load_data(os.path.getmtime(DATASET_PATH), AGGREGATES_VERSION)
+    
+    # Create sidebar and select the precomputed aggregates
+    selected_year = create_sidebar(year_options)
+    charts = aggregates[selected_year]
+    
+    # Create dashboard sections, each rerunning on its own for local interactions
+    create_header()
+    kpi_block(kpi_totals, grp_years_changes, selected_year)
+    category_block(charts)
+    trends_block(charts)
+    products_block(charts)
+    shipping_block(charts)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
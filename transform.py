@@ -15,15 +15,22 @@ if __name__ == "__main__":
 
     # Set indexing
     mapping_manager = dict(data_reg_manager[["Region", "Regional Manager"]].values)
-    list_retentions = data_retention["Order ID"].to_list()
+    set_retentions = set(data_retention["Order ID"])
 
     # Enrich dataset from other sheets
-    data["is_retention"] = data["Order ID"].apply(
-        lambda order_id: order_id in list_retentions
-    )
-    data["region_manager"] = data["Region"].apply(
-        lambda region: mapping_manager[region]
-    )
+    data["is_retention"] = data["Order ID"].isin(set_retentions)
+    data["region_manager"] = data["Region"].map(mapping_manager)
 
-    # Save into Excel
-    data.to_excel("dataset/superstore_enriched.xlsx")
\ No newline at end of file
+    # Grouping keys as categoricals
+    data = data.astype({
+        "Category": "category",
+        "Region": "category",
+        "Segment": "category",
+        "Ship Mode": "category",
+        "Product Name": "category"
+    })
+
+    # Save into Parquet
+    data.to_parquet(
+        "dataset/superstore_enriched.parquet", engine="pyarrow", compression="zstd"
+    )